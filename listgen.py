@@ -11,63 +11,99 @@ import logging
 logging.basicConfig(level=logging.DEBUG)
 
 import requests_cache
-import dateutil.parser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yaml
-import json
 import random
 import re
 import time
 import datetime as dt
 import uuid
 import socket
+import functools
 
 from pathlib import Path
-from pprint import pprint
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, Union, Callable, Iterable
-from tqdm import tqdm
 
-from colorama import init as colorama_init
-from colorama import Fore, Back, Style
-colorama_init(autoreset=True)
+try:
+    from yaml import CSafeLoader as _YamlLoader     # libyaml based loader, if pyyaml was built with it
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson       # optional, faster parsing of the jellyfin responses
+except ImportError:
+    orjson = None
+
+
+_FUZZY_DEFAULT_RE = re.compile(r"[a-z0-9]+")
+_RATING_NUMBER_RE = re.compile(r"[0-9]+")
 
 
 class Toolkit:
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def join_url(*urls: str) -> str:
-        return re.sub(r"[^\:][\/]\/+", "/", "/".join(urls))
+        # only a handful of distinct endpoints are built, so the joined urls are cached
+        # collapse repeated slashes, but keep the double slash after the scheme
+        scheme, separator, path = "/".join(urls).rpartition("://")
+        while "//" in path:
+            path = path.replace("//", "/")
+        return scheme + separator + path
 
     @staticmethod
     def dict_priority_get(data: dict[str, Any], default_value: Any, primary_key: str, *secondary_keys: str) -> Any:
         # returns value of the first valid dictionary key, else the set default value
-        for key in [primary_key, *secondary_keys]:
-            value = data.get(key, ...)
-            if value is not ...:
+        if (value := data.get(primary_key, ...)) is not ...:
+            return value
+        for key in secondary_keys:
+            if (value := data.get(key, ...)) is not ...:
                 return value
         return default_value
 
     @staticmethod
     def dict_get_all(data: Iterable[dict], key: Any, default: Optional[Any] = None, discard: bool = False) -> list[Any]:
-        values = []
-        for entry in data:
-            if key not in entry and not discard:
-                values.append(default)
-            else:
-                values.append(entry.get(key, default))
-        return values
+        # returns the value of the key for every entry, entries without the key are discarded or get the default value
+        if discard:
+            return [ value for entry in data if (value := entry.get(key, ...)) is not ... ]
+        return [ entry.get(key, default) for entry in data ]
 
     @staticmethod
     def parse_list(value: Union[str, list[str]]) -> list[str]:
         if isinstance(value, str):
-            return re.split(r" *, *", value)
+            # plain string splitting, spaces around the commas are stripped
+            if " " not in value:
+                return value.split(",")
+            return [ element.strip(" ") for element in value.split(",") ]
         elif isinstance(value, list):
             return [ str(el) for el in value ]
         raise TypeError(f"Expected comma separated strings or list: {value}")
     
     @staticmethod
-    def match_fuzzy(fuzzy: str, available: Iterable, get_func: Callable, default: Any = None, pattern: re.Pattern = r"[a-z0-9]+") -> Any:
-        mapping = { re.findall(pattern, get_func(entry).lower())[0]: entry for entry in available }
-        return mapping.get(re.findall(pattern, fuzzy.lower())[0], default)
-    
+    def build_fuzzy_index(available: Iterable, get_func: Callable, pattern: re.Pattern = _FUZZY_DEFAULT_RE) -> dict[str, Any]:
+        # build the mapping once and reuse it for multiple lookups with lookup_fuzzy
+        return { pattern.findall(get_func(entry).lower())[0]: entry for entry in available }
+
+    @staticmethod
+    def lookup_fuzzy(index: dict[str, Any], fuzzy: str, default: Any = None, pattern: re.Pattern = _FUZZY_DEFAULT_RE) -> Any:
+        return index.get(pattern.findall(fuzzy.lower())[0], default)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def parse_isodate(value: str) -> dt.datetime:
+        # memoized, because many items fall back to the same default dates or years
+        # (bounded, because creation timestamps are nearly unique per item and would only fill the memo)
+        try:
+            # the C implementation handles Jellyfin's canonical timestamps since python 3.11
+            date = dt.datetime.fromisoformat(value)
+        except ValueError:
+            import dateutil.parser      # only imported for the rare timestamps fromisoformat can't parse
+            date = dateutil.parser.isoparse(value)
+        # make naive dates comparable with the utc timestamps of jellyfin
+        return date if date.tzinfo is not None else date.replace(tzinfo=dt.timezone.utc)
+
     @staticmethod
     def is_none(value: Any) -> bool:
         return value is None
@@ -81,22 +117,26 @@ class Toolkit:
         return list(items)[:limit]
 
     @staticmethod
-    def contains_any(setlike: Iterable, setlike_or_element: Union[Iterable, Any]) -> bool:
-        if isinstance(setlike_or_element, (set, list, Iterable)):
-            for element in set(setlike_or_element):
-                if element in setlike:
-                    return True
-            return False
-        return setlike_or_element in setlike
+    def contains_any_func(setlike: Iterable, multi_value: bool) -> Callable[[Any], bool]:
+        # returns a containment test specialized for a fixed container and value kind, to skip the type dispatch per call
+        # (multi values are lists of values, any of them has to be contained, strings are treated as a single value)
+        if multi_value:
+            if isinstance(setlike, (set, frozenset)):
+                return lambda values: not setlike.isdisjoint(values)
+            return lambda values: any(map(setlike.__contains__, values))
+        return setlike.__contains__
 
 
 
 class Jellyfin:
-    def __init__(self, *, server_url: str, username: str, password: str, headers: dict = {}):
-        self.__logger = logging.getLogger(f"{Path(__file__).stem}.{__class__.__name__}")
+    __logger = logging.getLogger(f"{Path(__file__).stem}.{__qualname__}")
+    _EXPIRE_AFTER = dt.timedelta(hours=1)       # lifespan of cached responses and of the in-memory memos
+    _ITEMS_CACHE_MAXSIZE = 4096                 # number of items kept in memory, the least recently used are dropped first
 
+    def __init__(self, *, server_url: str, username: str, password: str, headers: dict = {}, max_workers: int = 8, cache_backend: str = "sqlite"):
         self.app_name = "Jellyfin Media-Bar listgen"
         self.app_version = "0.0.1"
+        self.max_workers = max_workers          # number of concurrent requests for batched fetches
         self.__server_url = server_url
         
         # generate session persistent and device-dependent device name and id
@@ -105,15 +145,36 @@ class Jellyfin:
         self.__logger.debug("generated device='%s' and device_id='%s'", self.__device, self.__device_id)
         
         # create cached session with 1 hour lifespan and authenticate as a user with a password to get a token
+        # (use cache_backend="memory" for short-lived runs that don't need to persist the cache)
+        backend_options = {"wal": True, "fast_save": True} if cache_backend == "sqlite" else {}
         self.__session = requests_cache.CachedSession(
             cache_name=f"{self.__logger.name}.cache",
-            expire_after=dt.timedelta(hours=1),
+            backend=cache_backend,
+            expire_after=self._EXPIRE_AFTER,
+            urls_expire_after={                 # libraries and genres rarely change, keep them longer
+                "*/UserViews": dt.timedelta(days=1),
+                "*/Genres": dt.timedelta(days=1),
+            },
+            cache_control=True,                 # honor Cache-Control headers of the server
+            stale_if_error=True,                # serve expired responses on transient server errors
+            allowable_methods=("GET",),
+            **backend_options,
         )
+        # keep enough pooled connections alive for all concurrent requests and retry on transient connection errors
+        adapter = HTTPAdapter(pool_maxsize=max(10, max_workers), max_retries=Retry(total=3, backoff_factor=0.1))
+        self.__session.mount("http://", adapter)
+        self.__session.mount("https://", adapter)
         self.__session.headers.update(headers)
         self.__session.headers.update({
             "Authorization": f'MediaBrowser Client="{self.app_name}", Device="{self.__device}", DeviceId="{self.__device_id}", Version="{self.app_version}"',
         })
         self.__authenticate_as_user(username, password)
+
+        # keep the parsed responses in memory, until they expire like the cached responses of the session
+        self.__libraries_cache = None
+        self.__genres_cache = {}
+        self.__items_cache = OrderedDict()
+        self.__memos_expire_at = time.monotonic() + self._EXPIRE_AFTER.total_seconds()
     
     def __repr__(self) -> str:
         return f"{__class__.__name__}(server_url={self.__server_url.__repr__()}, username=***, password=***, headers={self.headers.__repr__()})\nuserid={self.__user_id.__repr__()}, token={self.__auth_token.__repr__()}"
@@ -125,8 +186,9 @@ class Jellyfin:
         )
         response.raise_for_status()
         
-        self.__auth_token = response.json()["AccessToken"]
-        self.__user_id = response.json()["User"]["Id"]
+        response_data = self.parse_response(response)
+        self.__auth_token = response_data["AccessToken"]
+        self.__user_id = response_data["User"]["Id"]
         self.__session.headers["Authorization"] += f', Token="{self.__auth_token}"'
         self.__logger.info("authenticated as userid=%s and got token=%s", self.__user_id, self.__auth_token)
 
@@ -141,8 +203,14 @@ class Jellyfin:
             params["SortOrder"] = "Ascending"
             params["Recursive"] = "true"
         params.update(url_params)
-        response = self.__session.get(url, params)
+        response = self.__session.get(url, params=params)
         response.raise_for_status()
+        return self.parse_response(response)
+
+    @staticmethod
+    def parse_response(response: requests_cache.AnyResponse) -> Any:
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
     
     def get_user(self, user_id: str) -> dict:
@@ -151,127 +219,161 @@ class Jellyfin:
     def get_item(self, item_id: str) -> dict:
         return self.get(Toolkit.join_url("Users", self.__user_id, "Items", item_id))
 
-    def get_items(self, item_ids: list[str], batch_size: int = 60) -> list[dict]:
-        items = []
+    def get_items(self, item_ids: list[str], batch_size: int = 60, **url_params: Any) -> list[dict]:
+        # items already fetched with the same url parameters are served from memory, only the missing ones are requested
+        # (jellyfin accepts ids with dashes or in upper case, but always returns them compact and lower case,
+        # so requested and returned ids are compared in that normalized form)
+        self.__expire_memos()
+        params_key = tuple(sorted(url_params.items()))
+        items = {}
+        missing_item_ids = []
+        for item_id in item_ids:
+            normalized_id = self.normalize_id(item_id)
+            if (item := self.__items_cache.get((params_key, normalized_id))) is not None:
+                self.__items_cache.move_to_end((params_key, normalized_id))
+                items[normalized_id] = item
+            else:
+                missing_item_ids.append(item_id)
+        if missing_item_ids:
+            for item in self.__fetch_items(missing_item_ids, batch_size, url_params):
+                normalized_id = self.normalize_id(item["Id"])
+                items[normalized_id] = self.__items_cache[params_key, normalized_id] = item
+            while len(self.__items_cache) > self._ITEMS_CACHE_MAXSIZE:
+                self.__items_cache.popitem(last=False)
+        # items unknown to the server are left out, ids requested in different forms are returned once
+        return [ items[normalized_id] for normalized_id in dict.fromkeys(map(self.normalize_id, item_ids)) if normalized_id in items ]
+
+    @staticmethod
+    def normalize_id(item_id: str) -> str:
+        return item_id.replace("-", "").lower()
+
+    def __fetch_items(self, item_ids: list[str], batch_size: int, url_params: dict[str, Any]) -> list[dict]:
         # split up item ids into chunks to prevent to long urls
         item_ids_chunks = [ item_ids[ind:ind+batch_size] for ind in range(0, len(item_ids), batch_size) ]
-        for chunk in item_ids_chunks:
-            items.extend(self.get(Toolkit.join_url("Users", self.__user_id, "Items"), {"ids": ",".join(chunk)}).get("Items", []))
-        return items
+        url = Toolkit.join_url("Users", self.__user_id, "Items")
+        if len(item_ids_chunks) <= 1:
+            # no need for a thread pool for a single request
+            return [ item for chunk in item_ids_chunks for item in self.get(url, {**url_params, "ids": ",".join(chunk)}).get("Items", []) ]
+        # fetch all chunks concurrently, map() keeps the results in chunk order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            responses = executor.map(lambda chunk: self.get(url, {**url_params, "ids": ",".join(chunk)}), item_ids_chunks)
+            return [ item for response in responses for item in response.get("Items", []) ]
 
     def get_all_items(self, **url_params: Any) -> list[dict]:
         return self.get(Toolkit.join_url("Users", self.__user_id, "Items"), url_params, include_sort=True).get("Items", [])
     
     def get_all_libraries(self) -> list[dict]:
-        return self.get("UserViews", include_userid=True).get("Items", [])
+        self.__expire_memos()
+        if self.__libraries_cache is None:
+            self.__libraries_cache = self.get("UserViews", include_userid=True).get("Items", [])
+        return self.__libraries_cache
     
     def get_all_genres(self, **url_params: Any) -> list[dict]:
-        return self.get("Genres", url_params, include_userid=True, include_sort=True).get("Items", [])
+        self.__expire_memos()
+        cache_key = tuple(sorted(url_params.items()))
+        if (genres := self.__genres_cache.get(cache_key)) is None:
+            genres = self.__genres_cache[cache_key] = self.get("Genres", url_params, include_userid=True, include_sort=True).get("Items", [])
+        return genres
+
+    def invalidate(self) -> None:
+        # drop the in-memory memos, the http cache of the session is not affected
+        self.__libraries_cache = None
+        self.__genres_cache.clear()
+        self.__items_cache.clear()
+        self.__memos_expire_at = time.monotonic() + self._EXPIRE_AFTER.total_seconds()
+
+    def __expire_memos(self) -> None:
+        # the memos must not outlive the responses they were parsed from
+        if time.monotonic() >= self.__memos_expire_at:
+            self.__logger.debug("in-memory memos expired")
+            self.invalidate()
         
 
 
 class Interval:
+    __logger = logging.getLogger(f"{Path(__file__).stem}.{__qualname__}")
+    __slots__ = ("__interval", "__interval_type", "__data_type", "__lower_bound", "__upper_bound", "__contains_impl")
+    _CONVERTERS = {
+        "numeric": float,
+        "alphabetic": str,
+        "date": lambda value: dt.datetime.strptime(value, r"%Y_%m_%d"),
+    }
+
     def __init__(self, interval: str):
-        self.__logger = logging.getLogger(f"{Path(__file__).stem}.{__class__.__name__}")
         self.__interval = str(interval)
         self.__parse_interval()
     
     def __repr__(self) -> str:
         return f"{__class__.__name__}(interval={self.__interval.__repr__()})"
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def parse(interval: str) -> "Interval":
+        # intervals are read-only after parsing, so equal interval strings share one instance
+        return Interval(interval)
+
+    @staticmethod
+    def _classify(value: Optional[str]) -> Optional[str]:
+        # decide the data type with a few character tests instead of one regex per type
+        if not value or not value.isascii():
+            return None
+        if value[0].isdigit():
+            if len(value) == 10 and value[4] == value[7] == "_" and value.replace("_", "").isdigit():
+                return "date"       # YYYY_MM_DD    (does not validate the date itself!)
+            if value.replace(".", "", 1).isdigit():
+                return "numeric"
+            return None
+        if value.isalpha() and value.islower():
+            return "alphabetic"
+        return None
+
     def __parse_interval(self) -> None:
         self.__data_type = None
         self.__lower_bound = None
         self.__upper_bound = None
 
-        numeric_pattern = r"[0-9]+(\.[0-9]+)?"
-        alphabetic_pattern = r"[a-z]+"
-        date_pattern = r"[0-9]{4}_[0-9]{2}_[0-9]{2}"    # YYYY_MM_DD    (does not validate the date itself!)
-        any_pattern = r"[^-]+"
-        separator_pattern = r" *- *"
-        
         # match interval type: closed, left-open, right-open, open, exact
-        if re.fullmatch(any_pattern + separator_pattern + any_pattern, self.__interval):
-            self.__interval_type = "closed"
-        elif re.fullmatch(separator_pattern + any_pattern, self.__interval):
-            self.__interval_type = "left-open"
-        elif re.fullmatch(any_pattern + separator_pattern, self.__interval):
-            self.__interval_type = "right-open"
-        elif re.fullmatch(separator_pattern, self.__interval):
-            self.__interval_type = "open"
-        elif re.fullmatch(any_pattern, self.__interval):
+        # (the separator is a single dash with optional spaces around it, so a plain split is enough)
+        bounds = [bound.strip(" ") for bound in self.__interval.split("-")]
+        if len(bounds) == 1 and self.__interval:
             self.__interval_type = "exact"
+        elif len(bounds) == 2:
+            self.__interval_type = {
+                (True, True): "closed",
+                (False, True): "left-open",
+                (True, False): "right-open",
+                (False, False): "open",
+            }[(bool(bounds[0]), bool(bounds[1]))]
         else:
             raise SyntaxError("Expected format: 'any-any' or 'any-' or '-any' or '-' or 'any'")
         
         self.__logger.debug("matched %s interval type", self.__interval_type)
 
-        # TODO: re-work the following using match-case syntax
-        # https://stackoverflow.com/questions/74713626/how-to-use-structural-pattern-matching-match-case-with-regex
-
         # extract lower and/or upper bound values
-        lower_bound, upper_bound, *_ = re.split(separator_pattern, self.__interval) + [None, None]
+        lower_bound, upper_bound, *_ = bounds + [None, None]
 
         # match data type: numeric, alphabetic, date
-        numeric_lower_bound = re.fullmatch(numeric_pattern, lower_bound)
-        numeric_upper_bound = re.fullmatch(numeric_pattern, upper_bound)
-        alphabetic_lower_bound = re.fullmatch(alphabetic_pattern, lower_bound)
-        alphabetic_upper_bound = re.fullmatch(alphabetic_pattern, upper_bound)
-        date_lower_bound = re.fullmatch(date_pattern, lower_bound)
-        date_upper_bound = re.fullmatch(date_pattern, upper_bound)
-        
         _is_inverted = False
         if self.__interval_type == "closed":
-            if numeric_lower_bound:
-                if numeric_upper_bound:
-                    self.__data_type = "numeric"
-                    self.__lower_bound = float(lower_bound)
-                    self.__upper_bound = float(upper_bound)
-                else:
-                    raise TypeError(f"Expected numeric data type for upper bound: {upper_bound}")
-            elif alphabetic_lower_bound:
-                if alphabetic_upper_bound:
-                    self.__data_type = "alphabetic"
-                    self.__lower_bound = str(lower_bound)
-                    self.__upper_bound = str(upper_bound)
-                else:
-                    raise TypeError(f"Expected alphabetic data type for upper bound: {upper_bound}")
-            elif date_lower_bound:
-                if date_upper_bound:
-                    self.__data_type = "date"
-                    self.__lower_bound = dt.datetime.strftime(lower_bound, r"%Y_%m_%d")
-                    self.__upper_bound = dt.datetime.strftime(upper_bound, r"%Y_%m_%d")
-                else:
-                    raise TypeError(f"Expected date data type for upper bound: {upper_bound}")
-            else:
+            lower_type = self._classify(lower_bound)
+            if lower_type is None or lower_type != self._classify(upper_bound):
                 raise TypeError(f"Expected same data type numeric, alphabetic or date for lower bound ({lower_bound}) and upper bound ({upper_bound}).")
+            self.__data_type = lower_type
+            self.__lower_bound = self._CONVERTERS[lower_type](lower_bound)
+            self.__upper_bound = self._CONVERTERS[lower_type](upper_bound)
             _is_inverted = self.__lower_bound > self.__upper_bound
             
         elif self.__interval_type == "left-open":
-            if numeric_upper_bound:
-                self.__data_type = "numeric"
-                self.__upper_bound = float(upper_bound)
-            elif alphabetic_upper_bound:
-                self.__data_type = "alphabetic"
-                self.__upper_bound = str(upper_bound)
-            elif date_upper_bound:
-                self.__data_type = "date"
-                self.__upper_bound = dt.datetime.strftime(upper_bound, r"%Y_%m_%d")
-            else:
+            if (upper_type := self._classify(upper_bound)) is None:
                 raise TypeError(f"Expected data type numeric, alphabetic or date for upper bound: {upper_bound}")
+            self.__data_type = upper_type
+            self.__upper_bound = self._CONVERTERS[upper_type](upper_bound)
             
         elif self.__interval_type == "right-open" or self.__interval_type == "exact":
-            if numeric_lower_bound:
-                self.__data_type = "numeric"
-                self.__lower_bound = float(lower_bound)
-            elif alphabetic_lower_bound:
-                self.__data_type = "alphabetic"
-                self.__lower_bound = str(lower_bound)
-            elif date_lower_bound:
-                self.__data_type = "date"
-                self.__lower_bound = dt.datetime.strftime(lower_bound, r"%Y_%m_%d")
-            else:
+            if (lower_type := self._classify(lower_bound)) is None:
                 raise TypeError(f"Expected data type numeric, alphabetic or date for lower bound: {lower_bound}")
+            self.__data_type = lower_type
+            self.__lower_bound = self._CONVERTERS[lower_type](lower_bound)
         
         elif self.__interval_type == "open":
             self.__data_type = None
@@ -284,137 +386,141 @@ class Interval:
             "parsed interval '%s' as %s%s interval from %s to %s", 
             self.__interval, "inverted" if _is_inverted else "", self.__interval_type, self.__lower_bound, self.__upper_bound
         )
+        self.__contains_impl = self.__bind_contains()
+
+    def __bind_contains(self) -> Callable[[Any], bool]:
+        # the interval type and bounds are fixed after parsing, so choose the range check only once
+        lower_bound, upper_bound = self.__lower_bound, self.__upper_bound
+        match self.__interval_type:
+            case "open":
+                # always in range without bounding
+                return lambda value: True
+            case "closed" if lower_bound > upper_bound:
+                # lower bound higher than upper bound is allowed and inverts the condition
+                return lambda value: lower_bound <= value or value <= upper_bound
+            case "closed":
+                return lambda value: lower_bound <= value <= upper_bound
+            case "left-open":
+                return lambda value: value <= upper_bound
+            case "right-open":
+                return lambda value: lower_bound <= value
+            case "exact":
+                return lambda value: lower_bound == value
+        raise ValueError(f"Unknown interval type '{self.__interval_type}'")
     
     def __contains__(self, value: Any) -> bool:
-        return self.contains(value)
+        return self.__contains_impl(value)
     
     def contains(self, value: Any) -> bool:
-        # always in range without bounding
-        if self.__interval_type == "open":
-            return True
-        
-        # check if value is in range, depending on the interval type
-        if self.__interval_type == "closed":
-            # lower bound higher than upper bound is allowed and inverts the condition
-            if self.__lower_bound > self.__upper_bound:
-                return self.__lower_bound <= value or value <= self.__upper_bound
-            else:
-                return self.__lower_bound <= value <= self.__upper_bound
-        
-        elif self.__interval_type == "left-open":
-            return value <= self.__upper_bound
-        elif self.__interval_type == "right-open":
-            return self.__lower_bound <= value
-        
-        elif self.__interval_type == "exact":
-            return self.__lower_bound == value
-
-        raise ValueError(f"Unknown interval type '{self.__interval_type}'")
+        return self.__contains_impl(value)
 
 
 
 class StaticPlaylist:
-    def __init__(self, *, name: str, item_ids: list[str], sort_by: str, sort_ascending: bool, sort_strict: bool, limit: Optional[int] = None):
-        self.__logger = logging.getLogger(f"{Path(__file__).stem}.{__class__.__name__}")
+    __logger = logging.getLogger(f"{Path(__file__).stem}.{__qualname__}")
+    __slots__ = ("name", "item_ids", "sort_by", "sort_ascending", "sort_strict", "limit", "__sort_func")
+    _SUPPORTED_SORT_BY = frozenset({                                            # data types:
+        "order", "random",                                                      #   any
+        "Name", "OriginalTitle", "SortName",                                    #   string
+        "DateCreated", "PremiereDate",                                          #   datetime
+        "CriticRating", "CommunityRating", "RunTimeTicks", "ProductionYear",    #   number
+    })
+    # request only the optional fields needed for sorting
+    _METADATA_URL_PARAMS = {"fields": "DateCreated,SortName,OriginalTitle", "enableImages": "false", "enableUserData": "false"}
 
+    def __init__(self, *, name: str, item_ids: list[str], sort_by: str, sort_ascending: bool, sort_strict: bool, limit: Optional[int] = None):
         self.name = name
-        self.item_ids = sorted(set(item_ids), key=item_ids.index)       # remove duplicate item ids
+        self.item_ids = list(dict.fromkeys(item_ids))                   # remove duplicate item ids, keep order
         self.sort_by = sort_by
         self.raise_for_unsupported_sort_by()
         self.sort_ascending = sort_ascending
         self.sort_strict = sort_strict
         self.limit = limit
+        # sort_by and sort_strict don't change, so resolve the key function only once
+        self.__sort_func = None if sort_by in ("order", "random") else self.__build_sort_func(sort_by, sort_strict)
         
     def __repr__(self) -> str:
         return f"{__class__.__name__}(name={self.name.__repr__()}, item_ids={self.item_ids.__repr__()}, sort_by={self.sort_by.__repr__()}, sort_ascending={self.sort_ascending.__repr__()}, sort_strict={self.sort_strict.__repr__()}, limit={self.limit.__repr__()})"
 
     def raise_for_unsupported_sort_by(self) -> None:
-        self.__supported_sort_by = {                                                # data types:
-            "order", "random",                                                      #   any
-            "Name", "OriginalTitle", "SortName",                                    #   string
-            "DateCreated", "PremiereDate",                                          #   datetime
-            "CriticRating", "CommunityRating", "RunTimeTicks", "ProductionYear",    #   number
-        }
-        if self.sort_by not in self.__supported_sort_by:
+        if self.sort_by not in self._SUPPORTED_SORT_BY:
             raise ValueError(f"Can't sort by '{self.sort_by}'")
 
+    @staticmethod
+    def __build_sort_func(sort_by: str, sort_strict: bool) -> Callable[[dict], Any]:
+        # returns a key function specialized to the sort_by and sort_strict values
+        parse_isodate = Toolkit.parse_isodate
+
+        if not sort_strict:
+            # use a non-strict sorting function if there is one, that falls back to a similar key if the item lacks the key
+            sort_func = None
+            match sort_by:
+                case "Name" | "OriginalTitle" | "SortName":
+                    sort_func = lambda metadata: str(Toolkit.dict_priority_get(metadata, "", sort_by, "SortName", "Name"))
+                case "CriticRating":
+                    sort_func = lambda metadata: float(rating) if (rating := metadata.get("CriticRating")) is not None else float(metadata.get("CommunityRating") or 0) * 10
+                case "CommunityRating":
+                    sort_func = lambda metadata: float(rating) if (rating := metadata.get("CommunityRating")) is not None else float(metadata.get("CriticRating") or 0) / 10
+                case "PremiereDate":
+                    sort_func = lambda metadata: parse_isodate(date) if (date := metadata.get("PremiereDate")) is not None else parse_isodate(f"{metadata.get('ProductionYear', '0001')}-01-01")
+                case "ProductionYear":
+                    sort_func = lambda metadata: parse_isodate(f"{year}-01-01") if (year := metadata.get("ProductionYear")) is not None else parse_isodate(str(metadata.get("PremiereDate", "0001-01-01")))
+            if sort_func is not None:
+                StaticPlaylist.__logger.debug("non-strict sorting function defined")
+                return sort_func
+            StaticPlaylist.__logger.debug("no non-strict sorting function found")
+
+        StaticPlaylist.__logger.debug("strict sorting function defined")
+        match sort_by:
+            case "Name" | "OriginalTitle" | "SortName":
+                return lambda metadata: str(metadata.get(sort_by, ""))
+            case "DateCreated" | "PremiereDate":
+                return lambda metadata: parse_isodate(str(metadata.get(sort_by, "0001-01-01")))
+            case "CriticRating" | "CommunityRating" | "RunTimeTicks" | "ProductionYear":
+                return lambda metadata: float(metadata.get(sort_by, 0))
+        raise LookupError("missing sort_func")
+
     def sort(self, jellyfin: Jellyfin) -> list[str]:
-        self.raise_for_unsupported_sort_by()
+        # sort_by is already validated when the playlist is created
         self.__logger.debug("sort static playlist '%s' by '%s'", self.name, self.sort_by)
         
         match self.sort_by:
             case "order":
-                item_ids = self.item_ids[:] if self.sort_ascending else self.item_ids[::-1]
-                return Toolkit.limit(item_ids, self.limit, self.__logger)
+                # slice only the requested number of items instead of copying the whole list
+                if self.limit is None:
+                    return self.item_ids[:] if self.sort_ascending else self.item_ids[::-1]
+                self.__logger.debug("limit number of items to %d", self.limit)
+                return self.item_ids[:self.limit] if self.sort_ascending else self.item_ids[:-self.limit-1:-1]
             case "random":
+                # draw only the requested number of items instead of shuffling all of them
+                if self.limit is not None and 0 <= self.limit < len(self.item_ids):
+                    self.__logger.debug("limit number of items to %d", self.limit)
+                    return random.sample(self.item_ids, self.limit)
                 item_ids = self.item_ids[:]
                 random.shuffle(item_ids)
-                return Toolkit.limit(item_ids, self.limit, self.__logger)
+                # negative limits keep the slicing semantics of the order sort
+                return item_ids if self.limit is None else item_ids[:self.limit]
         
-        # request item metadata from jellyfin
-        items_metadata = jellyfin.get_items(self.item_ids)
+        # request item metadata from jellyfin, with only the optional fields needed for sorting
+        items_metadata = jellyfin.get_items(self.item_ids, **self._METADATA_URL_PARAMS)
         self.__logger.debug("fetched %d items", len(items_metadata))
 
-        # define strict sorting function
-        sort_func = None
-
-        match self.sort_by:
-            case "Name" | "OriginalTitle" | "SortName":
-                sort_func = lambda metadata: str(metadata.get(self.sort_by, ""))
-            case "DateCreated" | "PremiereDate":
-                sort_func = lambda metadata: dateutil.parser.isoparse(str(metadata.get(self.sort_by, "0001-01-01")))                    
-            case "CriticRating" | "CommunityRating" | "RunTimeTicks" | "ProductionYear":
-                sort_func = lambda metadata: float(metadata.get(self.sort_by, 0))
-        
-        if sort_func is None:
-            raise LookupError("missing sort_func")
-        
-        _strict_sort_func = sort_func
-        self.__logger.debug("strict sorting function defined")
-        
-        if not self.sort_strict:
-            # overwrite strict sorting function if there is one
-            match self.sort_by:
-                case "Name" | "OriginalTitle" | "SortName":
-                    sort_func = lambda metadata: str(Toolkit.dict_priority_get(metadata, "", self.sort_by, "SortName", "Name"))
-                
-                case "CriticRating" | "CommunityRating":
-                    def sort_func(metadata):
-                        if (rating := metadata.get(self.sort_by)) is not None:
-                            return float(rating)
-                        if self.sort_by == "CriticRating":
-                            return float(metadata.get("CommunityRating", 0)) * 10
-                        elif self.sort_by == "CommunityRating":
-                            return float(metadata.get("CriticRating", 0)) / 10
-
-                case "PremiereDate" | "ProductionYear":
-                    def sort_func(metadata):
-                        if (dateyear := metadata.get(self.sort_by)) is not None:
-                            return dateutil.parser.isoparse(dateyear if self.sort_by == "PremiereDate" else f"{dateyear}-01-01")
-                        if self.sort_by == "PremiereDate":
-                            return dateutil.parser.isoparse(f"{metadata.get('ProductionYear', '0001')}-01-01")
-                        elif self.sort_by == "ProductionYear":
-                            return dateutil.parser.isoparse(str(metadata.get("PremiereDate", "0001-01-01")))
-
-            if sort_func is not _strict_sort_func:
-                self.__logger.debug("strict sorting function replaced")
-            else:
-                self.__logger.debug("no non-strict sorting function found")
-        
-        # apply the defined sort function
-        items_metadata.sort(key=sort_func, reverse=not self.sort_ascending)
+        # apply the sort function resolved on creation
+        items_metadata.sort(key=self.__sort_func, reverse=not self.sort_ascending)
         items_metadata = Toolkit.limit(items_metadata, self.limit, self.__logger)
-        self.__logger.debug("sorted items order: %s", [ f"{item['Id']}: {item['Name']}" for item in items_metadata ])
+        if self.__logger.isEnabledFor(logging.DEBUG):
+            self.__logger.debug("sorted items order: %s", [ f"{item['Id']}: {item['Name']}" for item in items_metadata ])
         
-        item_ids = Toolkit.dict_get_all(items_metadata, "Id")
+        item_ids = [ item["Id"] for item in items_metadata ]
         return item_ids
 
 
     
 class DynamicPlaylist:
-    def __init__(self, *, name: str, limit: int, include: dict[str, Any], exclude: dict[str, Any], sort_by: str, sort_ascending: bool, sort_strict: bool):
-        self.__logger = logging.getLogger(f"{Path(__file__).stem}.{__class__.__name__}")
+    __logger = logging.getLogger(f"{Path(__file__).stem}.{__qualname__}")
+    __slots__ = ("name", "limit", "include", "exclude", "sort_by", "sort_ascending", "sort_strict")
 
+    def __init__(self, *, name: str, limit: int, include: dict[str, Any], exclude: dict[str, Any], sort_by: str, sort_ascending: bool, sort_strict: bool):
         self.name = name
         self.limit = limit
         self.include = include
@@ -428,15 +534,25 @@ class DynamicPlaylist:
 
     def compile(self, jellyfin: Jellyfin) -> StaticPlaylist:
         self.__logger.debug("compile dynamic playlist '%s'", self.name)
+        _debug = self.__logger.isEnabledFor(logging.DEBUG)      # skip building lists only used for debug messages
 
         # START OF PARSING FILTERS FOR ITEM COLLECTION
         # ============================================
 
         # create a static playlist based on a variety of filters
-        get_all_items__url_params = {}
+        # (besides the base fields, only request the optional fields read by the used filters, sorting fetches its own fields)
+        filter_name_fields = {"tags": "Tags", "people_ids": "People", "custom_rating": "CustomRating"}
+        used_filter_names = self.include.keys() | self.exclude.keys()
+        get_all_items__url_params = {
+            "enableImages": "false",
+            "enableUserData": "false",
+        }
+        if fields := [ field for filter_name, field in filter_name_fields.items() if filter_name in used_filter_names ]:
+            get_all_items__url_params["fields"] = ",".join(fields)
 
         # get allowed item types list to include by default all
-        item_types = set(map(str.lower, ["AggregateFolder", "BoxSet", "CollectionFolder", "Episode", "Movie", "Season", "Series", "Video"]))
+        canonical_item_types = { item_type.lower(): item_type for item_type in ["AggregateFolder", "BoxSet", "CollectionFolder", "Episode", "Movie", "Season", "Series", "Video"] }
+        item_types = set(canonical_item_types)
         if (include_item_types := self.include.get("item_types")) is not None:
             item_types &= set(map(str.lower, Toolkit.parse_list(include_item_types)))
         elif (exclude_item_types := self.exclude.get("item_types")) is not None:
@@ -448,20 +564,23 @@ class DynamicPlaylist:
         # get genres list to include by default all
         genres = None
         jellyfin_genres = jellyfin.get_all_genres()
-        self.__logger.debug("available genres: %s", Toolkit.dict_get_all(jellyfin_genres, "Name"))
+        if _debug:
+            self.__logger.debug("available genres: %s", Toolkit.dict_get_all(jellyfin_genres, "Name"))
 
-        match_genre_name = lambda genre: Toolkit.match_fuzzy(genre, jellyfin_genres, lambda genre: genre["Name"], "")
+        genre_index = Toolkit.build_fuzzy_index(jellyfin_genres, lambda genre: genre["Name"])
+        match_genre_name = lambda genre: Toolkit.lookup_fuzzy(genre_index, genre, "")
         
         if (include_genres := self.include.get("genres")) is not None:
             genres = filter(len, map(match_genre_name, Toolkit.parse_list(include_genres)))
         elif (exclude_genres := self.exclude.get("genres")) is not None:
-            genres = filter(len, map(match_genre_name, Toolkit.parse_list(exclude_genres)))
-            genres = set(jellyfin_genres) - set(genres)
+            excluded_genre_ids = { genre["Id"] for genre in filter(len, map(match_genre_name, Toolkit.parse_list(exclude_genres))) }
+            genres = [ genre for genre in jellyfin_genres if genre["Id"] not in excluded_genre_ids ]
 
         if genres is not None and genres is not []:
             genres = list(genres)
             get_all_items__url_params["genreIds"] = "|".join(Toolkit.dict_get_all(genres, "Id"))
-            self.__logger.debug("include genres: %s", Toolkit.dict_get_all(genres, "Name"))
+            if _debug:
+                self.__logger.debug("include genres: %s", Toolkit.dict_get_all(genres, "Name"))
 
         # get allowed library types list to include by default all
         library_types = set(map(str.lower, ["unknown", "movies", "tvshows", "homevideos", "boxsets", "playlists", "folders"]))
@@ -476,9 +595,10 @@ class DynamicPlaylist:
 
         # get libraries list to include by default all
         libraries = list(filter(lambda library: library["CollectionType"].lower() in library_types, jellyfin.get_all_libraries()))
-        self.__logger.debug("available libraries: %s", [ f"{lib['Id']}: {lib['Name']}" for lib in libraries ])
+        if _debug:
+            self.__logger.debug("available libraries: %s", [ f"{lib['Id']}: {lib['Name']}" for lib in libraries ])
  
-        library_ids = set(Toolkit.dict_get_all(libraries, "Id"))
+        library_ids = { library["Id"] for library in libraries }
         if (include_library_ids := self.include.get("library_ids")) is not None:
             library_ids &= set(filter(bool, Toolkit.parse_list(include_library_ids)))
         elif (exclude_library_ids := self.exclude.get("library_ids")) is not None:
@@ -489,26 +609,43 @@ class DynamicPlaylist:
         # START OF COLLECTING ALL ITEMS BASED ON COLLECTED FILTERS LIKE: LIBRARY, MEDIA TYPE AND GENRE
         # ===========================================================================================
 
-        # get all items from all filtered libraries
+        # get all items from all filtered libraries, one concurrent request per library
         all_items = []
-        for library_id in library_ids:
-            new_items = jellyfin.get_all_items(parentId=library_id, filters="IsNotFolder", **get_all_items__url_params)
-            self.__logger.debug("fetched %d items from library id %s", len(new_items), library_id)
-            all_items.extend(new_items)
+        library_ids = list(library_ids)
+        with ThreadPoolExecutor(max_workers=jellyfin.max_workers) as executor:
+            fetched_items = executor.map(
+                lambda library_id: jellyfin.get_all_items(parentId=library_id, filters="IsNotFolder", **get_all_items__url_params),
+                library_ids
+            )
+            for library_id, new_items in zip(library_ids, fetched_items):
+                self.__logger.debug("fetched %d items from library id %s", len(new_items), library_id)
+                all_items.extend(new_items)
         
         self.__logger.debug("fetched %d items", len(all_items))
 
-        # remove items, to exclude always
+        # items to exclude always
         if (exclude_item_ids := self.exclude.get("item_ids")) is not None:
-            exclude_item_ids = set(filter(bool, Toolkit.parse_list(exclude_item_ids)))
-            all_items = list(filter(lambda item: item["Id"] not in exclude_item_ids, all_items))
+            exclude_item_ids = { item_id for item_id in Toolkit.parse_list(exclude_item_ids) if item_id }
             self.__logger.debug("exclude item_ids: %s", exclude_item_ids)
+        else:
+            exclude_item_ids = set()
+
+        # jellyfin returns a small vocabulary of types in fixed casing, so match against the casing variants
+        # instead of lowercasing the types of every item
+        item_type_variants = frozenset(
+            variant
+            for item_type in item_types
+            for variant in (item_type, item_type.capitalize(), item_type.upper(), canonical_item_types.get(item_type, item_type))
+        )
 
-        # remove items of excluded item type
+        # remove items to exclude always and items of excluded item type in a single pass
         _len_all_items_before = len(all_items)
-        
-        all_items = list(filter(lambda item: item.get("MediaType", "").lower() in item_types or item.get("Type", "").lower(), all_items))
-        self.__logger.debug("removed %d items of excluded item type", _len_all_items_before - len(all_items))
+        all_items = [
+            item for item in all_items
+            if item["Id"] not in exclude_item_ids
+            and (item.get("MediaType", "") in item_type_variants or item.get("Type", "") in item_type_variants)
+        ]
+        self.__logger.debug("removed %d excluded items and items of excluded item type", _len_all_items_before - len(all_items))
 
         # START OF PARSING FILTERS FOR FILTERING ITEMS OUT
         # ================================================
@@ -519,15 +656,15 @@ class DynamicPlaylist:
         # get years interval or list
         if (include_years := self.include.get("years")) is not None:
             try:
-                includes["years"] = Interval(include_years)
-            except SyntaxError:
-                includes["years"] = list(filter(int, Toolkit.parse_list(include_years)))
+                includes["years"] = Interval.parse(include_years)
+            except (SyntaxError, TypeError):
+                includes["years"] = frozenset(map(int, filter(bool, Toolkit.parse_list(include_years))))
             self.__logger.debug("include years: %s", includes["years"])
         elif (exclude_years := self.exclude.get("years")) is not None:
             try:
-                excludes["years"] = Interval(exclude_years)
-            except SyntaxError:
-                excludes["years"] = list(filter(int, Toolkit.parse_list(exclude_years)))
+                excludes["years"] = Interval.parse(exclude_years)
+            except (SyntaxError, TypeError):
+                excludes["years"] = frozenset(map(int, filter(bool, Toolkit.parse_list(exclude_years))))
             self.__logger.debug("exclude years: %s", excludes["years"])
             
         # get all list filters
@@ -543,16 +680,16 @@ class DynamicPlaylist:
 
         # get all interval filters
         interval_filter_names = [
-            "startwith_name", "runtime", "people_ids",
+            "startwith_name", "runtime",
             "community_rating", "critic_rating", "official_rating", "custom_rating",
         ]
         for filter_name in interval_filter_names:
             
             if (include_filter := self.include.get(filter_name)) is not None:
-                includes[filter_name] = Interval(str(include_filter).lower())
+                includes[filter_name] = Interval.parse(str(include_filter).lower())
                 self.__logger.debug("include %s: %s", filter_name, includes[filter_name])
             elif (exclude_filter := self.exclude.get(filter_name)) is not None:
-                excludes[filter_name] = Interval(str(exclude_filter).lower())
+                excludes[filter_name] = Interval.parse(str(exclude_filter).lower())
                 self.__logger.debug("exclude %s: %s", filter_name, excludes[filter_name])
         
         self.__logger.debug("%d include filters set", len(includes))
@@ -561,75 +698,74 @@ class DynamicPlaylist:
         # START OF FILTERING ALL COLLECTED ITEMS BASED ON COLLECTED FILTERS LIKE: YEAR, TAGS, RUNTIME, RATINGS, ETC.
         # ==========================================================================================================
 
+        # names are compared by their beginning, as many letters as the longest bound of the startwith_name filter has
+        startwith_name = self.include.get("startwith_name", self.exclude.get("startwith_name", ""))
+        startwith_length = max(map(len, str(startwith_name).replace(" ", "").split("-")))
+
         filter_name_get_func = {
             "years":            lambda item: item.get("ProductionYear"),
-            "tags":             lambda item: item.get("Tags"),
-            "startwith_name":   lambda item: item.get("Name"),
+            "tags":             lambda item: None if len(_tags := item.get("Tags", [])) == 0 else [ tag.lower() for tag in _tags ],
+            "startwith_name":   lambda item: None if (name := item.get("Name")) is None else name[:startwith_length].casefold(),   # alphabetic bounds are lower case
             "runtime":          lambda item: None if (ticks := item.get("RunTimeTicks")) is None else ticks / 10_000_000 / 60,
-            "people_ids":       lambda item: None if len(_ids := Toolkit.dict_get_all(item.get("People", []), "Id", discard=True)) == 0 else _ids,
+            "people_ids":       lambda item: [ person["Id"] for person in item.get("People", []) if "Id" in person ] or None,
             "community_rating": lambda item: item.get("CommunityRating"),
             "critic_rating":    lambda item: item.get("CriticRating"),
             "official_rating":  lambda item: item.get("OfficialRating"),
             "custom_rating":    lambda item: item.get("CustomRating"),
         }
 
-        # collect all items, where their specific values are contained in the specific include filter value
-        if len(includes) != 0:
-            included_items = []
-            for item in all_items:
-                self.__logger.debug("check item for includes: %s", item["Name"])
-                for filter_name, filter_value in includes.items():
-                    # get function of specific filter that extracts the value from the item dict
-                    if (get_func := filter_name_get_func.get(filter_name)) is None:
-                        self.__logger.warning("no getter function found for filter name: %s", filter_name)
-                        continue
-                    # get the value of the filter from the item dict
-                    if (item_value := get_func(item)) is None:
-                        self.__logger.debug("skip item without %s value", filter_name)
-                        continue
-                    # check if filter value contains value of item (only works, because all filters are of type list, set or Interval)
-                    if Toolkit.contains_any(filter_value, item_value):
-                        self.__logger.debug("include item %s", item["Name"])
-                        included_items.append(item)
-        else:
-            included_items = all_items
-
-        _len_included_items_before = len(included_items)
-        self.__logger.debug("included %d items", _len_included_items_before)
-
-        # remove all items, where their specific values are contained in the specific exclude filter value
-        excluded_items = []
-        if len(excludes) != 0:
-            for item in included_items:
-                self.__logger.debug("check item for excludes: %s", item["Name"])
-                for filter_name, filter_value in excludes.items():
-                    # get function of specific filter that extracts the value from the item dict
-                    if (get_func := filter_name_get_func.get(filter_name)) is None:
-                        self.__logger.warning("no getter function found for filter name: %s", filter_name)
-                        continue
-                    # get the value of the filter from the item dict
-                    if (item_value := get_func(item)) is None:
-                        self.__logger.debug("skip item without %s value", filter_name)
-                        continue
-                    # check if filter value not contains value of item (only works, because all filters are of type list, set or Interval)
-                    if not Toolkit.contains_any(filter_value, item_value):
-                        self.__logger.debug("exclude item %s", item["Name"])
-                        excluded_items.append(item)
-
-        self.__logger.debug("excluded %d items", len(excluded_items))
-        
-        # get item ids
-        item_ids = []
-        item_ids.extend( set(Toolkit.dict_get_all(included_items, "Id")) - set(Toolkit.dict_get_all(excluded_items, "Id")) )
+        # filters where the item value is a list of values, any of them has to be contained in the filter value
+        multi_value_filter_names = {"tags", "people_ids"}
+
+        # extract the values of all used filters in one pass, as one column per filter (None if the item has no value)
+        columns = {}
+        for filter_name in includes.keys() | excludes.keys():
+            if (get_func := filter_name_get_func.get(filter_name)) is None:
+                self.__logger.warning("no getter function found for filter name: %s", filter_name)
+                continue
+            columns[filter_name] = [ get_func(item) for item in all_items ]
+
+        # keep all items, where their specific values are contained in every include filter value
+        # (only works, because all filters are of type list, set or Interval)
+        include_mask = [True] * len(all_items)
+        for filter_name, filter_value in includes.items():
+            if (column := columns.get(filter_name)) is None:
+                continue
+            contains = Toolkit.contains_any_func(filter_value, filter_name in multi_value_filter_names)
+            include_mask = [
+                keep and item_value is not None and contains(item_value)
+                for keep, item_value in zip(include_mask, column)
+            ]
+            if _debug:
+                self.__logger.debug("%d items left after include filter %s", sum(include_mask), filter_name)
+        _len_included_items = sum(include_mask)
+
+        self.__logger.debug("included %d items", _len_included_items)
+
+        # remove all included items, where their specific values are contained in any exclude filter value
+        # (items that are not included are marked as dropped up front, so the exclude filters skip them)
+        exclude_mask = [ not keep for keep in include_mask ]
+        for filter_name, filter_value in excludes.items():
+            if (column := columns.get(filter_name)) is None:
+                continue
+            contains = Toolkit.contains_any_func(filter_value, filter_name in multi_value_filter_names)
+            exclude_mask = [
+                drop or (item_value is not None and contains(item_value))
+                for drop, item_value in zip(exclude_mask, column)
+            ]
+
+        # get item ids of all items, that are included and not excluded
+        item_ids = [ item["Id"] for item, drop in zip(all_items, exclude_mask) if not drop ]
+        self.__logger.debug("excluded %d items", _len_included_items - len(item_ids))
         
         # add item ids, to include always
         if (include_item_ids := self.include.get("item_ids")) is not None:
-            include_item_ids = list(filter(bool, Toolkit.parse_list(include_item_ids)))
+            include_item_ids = [ item_id for item_id in Toolkit.parse_list(include_item_ids) if item_id ]
             item_ids.extend(include_item_ids)
             self.__logger.debug("include item_ids: %s", include_item_ids)
 
-        # remove duplicate ids
-        item_ids = list(set(item_ids))
+        # remove duplicate ids, keep order
+        item_ids = list(dict.fromkeys(item_ids))
         self.__logger.debug("after all filters, collected %d items", len(item_ids))
                 
         # create static playlist of all item ids
@@ -650,58 +786,72 @@ class DynamicPlaylist:
 
 
 class Conditional:
-    def __init__(self, name: str, conditions: dict[str, Any] = {}):
-        self.__logger = logging.getLogger(f"{Path(__file__).stem}.{__class__.__name__}")
+    __logger = logging.getLogger(f"{Path(__file__).stem}.{__qualname__}")
+    __slots__ = ("name", "conditions", "__disabled", "__selected", "__time_checks", "__user_age", "__time_checks_result")
+
+    # extracts the value of the current time, which is checked by the time condition of the same name
+    # (ordered from cheapest to most expensive, because the checks stop at the first failing condition)
+    _TIME_GETTERS = {
+        "hours":    lambda now: now.hour,               # from hour 0 to 23
+        "weekdays": lambda now: now.isoweekday(),       # from monday=1 to sunday=7
+        "days":     lambda now: now.day,                # from 1st day of the month up to 31st day
+        "months":   lambda now: now.month,              # from january=1 to december=12
+        "years":    lambda now: now.year,               # from year 1 AD up to year 9999 AD
+        "dates":    lambda now: now.replace(hour=0, minute=0, second=0, microsecond=0),     # date format YYYY_MM_DD
+        "weeks":    lambda now: now.isocalendar()[1],   # from 1st week of the year up to 52nd week
+    }
+
+    def __init__(self, name: str, conditions: Optional[dict[str, Any]] = None):
         self.name = name
-        self.conditions = conditions
+        self.conditions = conditions = {} if conditions is None else conditions
+
+        # the conditions don't change, so resolve them only once
+        self.__disabled = bool(conditions.get("disabled", False))
+        self.__selected = bool(conditions.get("selected", False))
+        self.__time_checks = tuple(
+            (get_func, Interval.parse(value))
+            for key, get_func in self._TIME_GETTERS.items()
+            if (value := conditions.get(key)) is not None
+        )
+        self.__user_age = None if (user_age := conditions.get("user_age")) is None else Interval.parse(user_age)
+        self.__time_checks_result = (None, True)     # (hour, result) of the last time checks
     
     def __repr__(self) -> str:
         return f"{__class__.__name__}(name={self.name.__repr__()}, conditions={self.conditions.__repr__()})"
-    
+
     def __bool__(self) -> bool:
         return self.is_true()
     
-    def is_true(self, *, jellyfin: Optional[Jellyfin] = None, user_id: Optional[str] = None) -> bool:
+    def is_true(self, *, jellyfin: Optional[Jellyfin] = None, user_id: Optional[str] = None, user: Optional[dict] = None) -> bool:
         self.__logger.debug("check conditional: %s", self.name)
 
-        if self.conditions.get("disabled", False):          # always disables the entry, ignoring all other conditions
+        if self.__disabled:         # always disables the entry, ignoring all other conditions
             return False
-        elif self.conditions.get("selected", False):        # always selects the entry, ignoring all other conditions
+        elif self.__selected:       # always selects the entry, ignoring all other conditions
             return True
         
-        if (hours := self.conditions.get("hours")) is not None:             # from hour 0 to 23
-            if not Interval(hours).contains(dt.datetime.now().hour):
-                return False
-        elif (weekdays := self.conditions.get("weekdays")) is not None:     # from monday=1 to sunday=7
-            if not Interval(weekdays).contains(dt.datetime.now().isoweekday()):
-                return False
-        elif (days := self.conditions.get("days")) is not None:             # from 1st day of the month up to 31st day
-            if not Interval(days).contains(dt.datetime.now().day):
-                return False
-        elif (weeks := self.conditions.get("weeks")) is not None:           # from 1st week of the year up to 52nd week
-            if not Interval(weeks).contains(dt.datetime.now().isocalendar()[1]):
-                return False
-        elif (months := self.conditions.get("months")) is not None:         # from january=1 to december=12
-            if not Interval(months).contains(dt.datetime.now().month):
-                return False
-        elif (years := self.conditions.get("years")) is not None:           # from year 1 AD up to year 9999 AD 
-            if not Interval(years).contains(dt.datetime.now().year):
-                return False
-        elif (dates := self.conditions.get("dates")) is not None:           # date format YYYY_MM_DD
-            if not Interval(dates).contains(dt.datetime.now()):
-                return False
+        # evaluate all time conditions against the same point in time, every condition must be met
+        # (no time condition is more precise than an hour, so the result is reused within the same hour)
+        now = dt.datetime.now()
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        if self.__time_checks_result[0] != hour:
+            result = all(interval.contains(get_func(now)) for get_func, interval in self.__time_checks)
+            self.__time_checks_result = (hour, result)
+        if not self.__time_checks_result[1]:
+            return False
         
-        # check conditions that require communication with jellyfin to get user data
-        if isinstance(jellyfin, Jellyfin) and user_id is not None:
-            self.__logger.debug("check conditional '%s' for userid='%s'", self.name, user_id)
+        # check conditions that require communication with jellyfin to get user data (if not already passed)
+        if user is None and isinstance(jellyfin, Jellyfin) and user_id is not None:
             user = jellyfin.get_user(user_id)
+        if user is not None:
+            self.__logger.debug("check conditional '%s' for userid='%s'", self.name, user.get("Id", user_id))
             
-            if (user_age := self.conditions.get("user_age")) is not None:
+            if self.__user_age is not None:
                 if (max_parental_rating := user.get("Policy", {}).get("MaxParentalRating")) is not None:
                     # extract age from parental rating label
                     # TODO: support all jellyfin ratings correctly
-                    parental_rating_num = int(re.findall(r"[0-9]+", f"0{max_parental_rating}")[0])
-                    if not Interval(user_age).contains(parental_rating_num):
+                    parental_rating_num = int(_RATING_NUMBER_RE.search(f"0{max_parental_rating}").group())
+                    if not self.__user_age.contains(parental_rating_num):
                         return False
     
         self.__logger.debug("conditional '%s' is true", self.name)
@@ -710,8 +860,9 @@ class Conditional:
 
 
 class MediaBar:
+    __logger = logging.getLogger(f"{Path(__file__).stem}.{__qualname__}")
+
     def __init__(self, *, filename: Path):
-        self.__logger = logging.getLogger(f"{Path(__file__).stem}.{__class__.__name__}")
         self.__filename = filename
         self.__parse_file()
     
@@ -721,8 +872,9 @@ class MediaBar:
     def __parse_file(self) -> None:
         self.__logger.debug("load mediabar config '%s'", self.__filename)
 
-        with open(self.__filename, "r", encoding="utf-8", errors="replace") as file:
-            filedata = yaml.load(file.read(), yaml.Loader)
+        # the loader reads the bytes directly from the file and detects the unicode encoding itself
+        with open(self.__filename, "rb") as file:
+            filedata = yaml.load(file, _YamlLoader)
         
         # all playlist names are converted to lower case when imported
         # altough the StaticPlaylist/DynamicPlaylist and Conditional classes don't requiere lower case names
@@ -745,19 +897,18 @@ class MediaBar:
             conditionals.append(new_conditional)
         return conditionals
 
-    def __parse_playlists(self, data: dict) -> list[Union[StaticPlaylist, DynamicPlaylist]]:
+    def __parse_playlists(self, data: dict) -> dict[str, Union[StaticPlaylist, DynamicPlaylist]]:
         self.__logger.debug("parse %d playlists", len(data))
 
-        unique_names = set()
-        playlists = []
+        # playlists by their lower case name
+        playlists = {}
         for entry in data:
             name = entry["name"].lower()
             items = entry["items"]
             _type = items.pop("type")       # only filters or item ids are left after popping the type
             
-            if name in unique_names:
+            if name in playlists:
                 raise KeyError(f"Playlist '{name}' is already defined.")
-            unique_names.add(name)
             
             if _type == "static":
                 new_playlist = StaticPlaylist(
@@ -790,11 +941,16 @@ class MediaBar:
             else:
                 raise ValueError(f"Unknown playlist type '{_type}'")
             
-            playlists.append(new_playlist)
+            playlists[name] = new_playlist
         return playlists
     
     def get_selected(self, **conditional_kwargs) -> Conditional:
         # returns first Conditional where all conditions are met, otherwise the last one
+        # (the user data is requested only once and shared by all conditionals)
+        jellyfin, user_id = conditional_kwargs.get("jellyfin"), conditional_kwargs.get("user_id")
+        if conditional_kwargs.get("user") is None and isinstance(jellyfin, Jellyfin) and user_id is not None:
+            conditional_kwargs["user"] = jellyfin.get_user(user_id)
+
         selected = self.conditionals[-1]
         for conditional in self.conditionals:
             if conditional.is_true(**conditional_kwargs):
@@ -803,11 +959,11 @@ class MediaBar:
         return selected
     
     def get_playlist(self, name: str) -> Union[StaticPlaylist, DynamicPlaylist]:
-        # returns first Playlist with matching name (with previous parsing, every playlist name should be unique)
-        for playlist in self.playlists:
-            if playlist.name.lower() == name.lower():
-                return playlist
-        raise KeyError(f"Selected playlist '{name}' not defined.")
+        # returns the Playlist with matching name (with previous parsing, every playlist name is unique and lower case)
+        # conditional names are already lower case, so only lowercase the name if there is no exact match
+        if (playlist := self.playlists.get(name)) is None and (playlist := self.playlists.get(name.lower())) is None:
+            raise KeyError(f"Selected playlist '{name}' not defined.")
+        return playlist
     
     def evaluate(self, jellyfin: Jellyfin, *, user_id: Optional[str] = None) -> tuple[str, list[str]]:
         # evaluates the whole imported config and returns the selected playlist name and sorted playlist item ids
@@ -821,8 +977,7 @@ class MediaBar:
     def export_legacy_format(playlist_name: str, item_ids: list[str], filename: Path = Path("list.txt")) -> None:
         # the name of the playlist, followed by a list of item ids, one per line
         with open(filename, "w", encoding="utf-8") as file:
-            file.write(f"{playlist_name}\n")
-            file.write("\n".join(item_ids))
+            file.write("\n".join([playlist_name, *item_ids]))
 
 
 